@@ -1,11 +1,32 @@
 import bpy
 import os
+import shutil
 import subprocess
 import json
 
+import numpy as np
+
+from collections import OrderedDict
+
+try:
+    import ijson  # optional: stream cues instead of materializing the dict
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: 2-4x faster decode than stdlib json
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange  # optional: JIT path for hour-long clips
+except ImportError:
+    njit = None
+    prange = range
+
 from bpy.props import (
     StringProperty, CollectionProperty, PointerProperty,
-    IntProperty, FloatVectorProperty, BoolProperty
+    IntProperty, FloatVectorProperty, EnumProperty
 )
 from bpy.types import Panel, Operator, PropertyGroup, UIList
 from bpy_extras.io_utils import ExportHelper, ImportHelper
@@ -21,14 +42,155 @@ bl_info = {
 }
 
 # — Utilities —
+AUDIO_EXTS = {".wav",".mp3",".ogg",".flac",".m4a",".aac"}
+
+def _run_cmd(cmd):
+    return subprocess.run(cmd).returncode
+
+def _ffprobe_from(ffmpeg):
+    head, tail = os.path.split(ffmpeg)
+    return os.path.join(head, tail.replace("ffmpeg", "ffprobe"))
+
+def _wav_ok_for_rhubarb(ffprobe, path):
+    # already mono 16-bit PCM at a rate rhubarb likes -> no transcode needed
+    try:
+        out = subprocess.run(
+            [ffprobe,"-v","error","-select_streams","a:0",
+             "-show_entries","stream=codec_name,sample_rate,channels",
+             "-of","json",path],
+            capture_output=True, check=True)
+        stream = json.loads(out.stdout)["streams"][0]
+        return (stream.get("codec_name") == "pcm_s16le"
+                and int(stream.get("channels", 0)) == 1
+                and int(stream.get("sample_rate", 0))
+                    in (16000, 22050, 44100, 48000))
+    except Exception:
+        # no ffprobe / unparsable: trust the extension like before
+        return path.lower().endswith(".wav")
+
 def parse_rhubarb_json(path):
-    with open(path, 'r', encoding='utf-8') as f:
-        d = json.load(f)
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            d = orjson.loads(f.read())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            d = json.load(f)
     if "mouthCues" in d:
         return d["mouthCues"]
     raise ValueError("Invalid Rhubarb JSON format")
 
+def iter_cues(path):
+    if ijson is not None:
+        found = False
+        with open(path, 'rb') as f:
+            # use_float: Decimal cue times would break the float math later
+            for cue in ijson.items(f, 'mouthCues.item', use_float=True):
+                found = True
+                yield cue
+        if not found:
+            # zero cues streamed: either a genuinely empty cue list or the
+            # wrong JSON shape — let the strict parser decide (it raises
+            # ValueError on malformed files, matching the non-ijson path)
+            yield from parse_rhubarb_json(path)
+    else:
+        yield from parse_rhubarb_json(path)
+
+def load_cues_soa(path):
+    # AoS -> SoA: three parallel arrays instead of per-cue dict lookups,
+    # so time->frame conversion happens in one vectorized pass
+    cues = load_cues(path)
+    n = len(cues)
+    starts = np.fromiter((c["start"] for c in cues),
+                         dtype=np.float32, count=n)
+    ends = np.fromiter((c.get("end", c["start"]+0.1) for c in cues),
+                       dtype=np.float32, count=n)
+    values = np.array([c["value"] for c in cues])
+    return starts, ends, values
+
+def _build_locs_kernel(st, ed, targets, step, blend):
+    # two-pass build: count keys per cue, then fill preallocated arrays;
+    # compiled by numba below when it is available
+    n = st.shape[0]
+    counts = np.empty(n, np.int64)
+    offsets = np.empty(n, np.int64)
+    total = 0
+    for i in range(n):
+        span = ed[i] - st[i]
+        if span < 0: span = 0
+        counts[i] = span // step + 1
+        offsets[i] = total
+        total += counts[i]
+    frames = np.empty(total, np.float32)
+    locs = np.empty((total, 3), np.float32)
+    for i in prange(n):
+        base = offsets[i]
+        for k in range(counts[i]):
+            f = st[i] + k*step
+            frames[base+k] = f
+            if i == 0 or blend <= 0:
+                t = 1.0
+            else:
+                t = (f - st[i]) / blend
+                if t > 1.0: t = 1.0
+            for a in range(3):
+                prev = targets[i-1, a] if i > 0 else targets[i, a]
+                locs[base+k, a] = prev*(1.0-t) + targets[i, a]*t
+    return frames, locs
+
+if njit is not None:
+    _build_locs_jit = njit(cache=True, fastmath=True, parallel=True)(
+        _build_locs_kernel)
+else:
+    _build_locs_jit = None
+
+def _tag_redraw(context):
+    # one deferred redraw for the whole batch instead of one per .add()
+    if context.screen is None: return
+    for area in context.screen.areas:
+        area.tag_redraw()
+
+def viseme_index(props):
+    # one hashed dict shared by import & generate: name -> (index, position)
+    return {v.name: (i, np.asarray(v.position, dtype=np.float32))
+            for i, v in enumerate(props.visemes)}
+
+_cue_cache = OrderedDict()
+_CUE_CACHE_MAX = 4  # a few clips' worth; bounded so stale parses don't pile up
+
+def load_cues(path):
+    # Both import and generate read the same file; parse it once per mtime
+    key = (path, os.path.getmtime(path))
+    cues = _cue_cache.get(key)
+    if cues is None:
+        cues = list(iter_cues(path))
+        _cue_cache[key] = cues
+        while len(_cue_cache) > _CUE_CACHE_MAX:
+            _cue_cache.popitem(last=False)
+    else:
+        _cue_cache.move_to_end(key)
+    return cues
+
 # — Data Models —
+_preview_items_ref = []  # keep enum item strings referenced (bpy quirk)
+
+def _preview_items(self, context):
+    global _preview_items_ref
+    _preview_items_ref = [('NONE', "None", "No preview")]
+    _preview_items_ref += [(v.name, v.name, "") for v in self.visemes]
+    return _preview_items_ref
+
+def _apply_preview(props, context):
+    # single active enum: O(1) toggle, nothing to clear on the other items
+    name = props.preview_active
+    if name in ('', 'NONE'): return
+    item = props.visemes.get(name)
+    if item is None: return
+    obj = context.object
+    if obj is None: return
+    bone = obj.pose.bones.get(props.target_bone)
+    if bone:
+        bone.location = item.position
+
 class VisemeItem(PropertyGroup):
     name: StringProperty(name="Viseme", default="A")
     position: FloatVectorProperty(
@@ -37,20 +199,6 @@ class VisemeItem(PropertyGroup):
         size=3, default=(0.0,0.0,0.0),
         precision=4
     )
-    preview: BoolProperty(
-        name="Preview", default=False,
-        description="Preview this viseme on the bone",
-        update=lambda self,ctx: self.update_preview(ctx)
-    )
-    def update_preview(self, context):
-        if not self.preview: return
-        props = context.scene.lipsync_props
-        for v in props.visemes:
-            if v is not self:
-                v.preview = False
-        bone = context.object.pose.bones.get(props.target_bone)
-        if bone:
-            bone.location = self.position
 
 class LipsyncProperties(PropertyGroup):
     audio_file: StringProperty(
@@ -75,14 +223,36 @@ class LipsyncProperties(PropertyGroup):
     )
     visemes: CollectionProperty(type=VisemeItem)
     active_viseme_index: IntProperty()
+    preview_active: EnumProperty(
+        name="Preview", items=_preview_items,
+        description="Viseme currently previewed on the bone"
+    )
     frame_step: IntProperty(
-        name="Frame Step", default=1,
+        name="Frame Step", default=1, min=1,
         description="Insert a keyframe every N frames"
     )
     blend_frames: IntProperty(
         name="Blend Frames", default=1,
         description="Cross-fade over first N frames of each viseme"
     )
+    key_interpolation: EnumProperty(
+        name="Interpolation",
+        items=[
+            ('LINEAR',"Linear","Straight blend between visemes"),
+            ('CONSTANT',"Constant","Snap to each viseme, no blending"),
+            ('BEZIER',"Bezier","Smoothed (slower to generate)"),
+        ],
+        default='LINEAR',
+        description="Interpolation mode for generated keyframes"
+    )
+    batch_dir: StringProperty(
+        name="Batch Folder", subtype='DIR_PATH',
+        description="Folder of audio files to process in one go"
+    )
+    batch_workers: IntProperty(
+        name="Workers", default=0, min=0,
+        description="Parallel FFmpeg/Rhubarb processes (0 = CPU count)"
+    )
 
 # — Preset Export/Import —
 class OT_ExportVisemePreset(Operator, ExportHelper):
@@ -114,11 +284,15 @@ class OT_ImportVisemePreset(Operator, ImportHelper):
         try:
             with open(self.filepath,'r',encoding='utf-8') as f:
                 data = json.load(f)
-            p.visemes.clear()
+            visemes = p.visemes
+            visemes.clear()
+            # only plain string/vector fields are set here, so no update=
+            # callbacks fire mid-loop; one redraw at the end covers the lot
             for e in data:
-                v = p.visemes.add()
+                v = visemes.add()
                 v.name = e.get("name","")
                 v.position = e.get("position",[0,0,0])
+            _tag_redraw(context)
             self.report({'INFO'},f"Preset loaded ← {self.filepath}")
         except Exception as e:
             self.report({'ERROR'},f"Import failed: {e}")
@@ -131,26 +305,158 @@ class OT_RunRhubarb(Operator):
     bl_label = "Run Rhubarb"
     bl_description = "Convert audio→WAV & run Rhubarb"
     bl_options = {'REGISTER'}
-    def execute(self, context):
+
+    _timer = None
+    _procs = ()
+    _pending = ()
+
+    def invoke(self, context, event):
         p = context.scene.lipsync_props
         audio_in = bpy.path.abspath(p.audio_file)
-        # if not WAV, convert
-        if not audio_in.lower().endswith(".wav"):
-            out_wav = os.path.splitext(audio_in)[0] + "_conv.wav"
-            subprocess.run([
-                bpy.path.abspath(p.ffmpeg_exe),
-                "-y","-i",audio_in,out_wav
-            ], check=True)
-            audio = out_wav
-        else:
-            audio = audio_in
-        out_txt = os.path.splitext(audio)[0] + "_rhubarb.txt"
-        subprocess.run([
-            bpy.path.abspath(p.rhubarb_exe),
-            "-f","json",audio,"-o",out_txt
-        ], check=True)
-        p.rhubarb_txt = out_txt
-        self.report({'INFO'},f"Output → {out_txt}")
+        ffmpeg = bpy.path.abspath(p.ffmpeg_exe)
+        rhubarb = bpy.path.abspath(p.rhubarb_exe)
+        self._out_txt = os.path.splitext(audio_in)[0] + "_rhubarb.txt"
+        self._pending = []
+        is_wav = audio_in.lower().endswith(".wav")
+        have_ffmpeg = bool(shutil.which(ffmpeg))
+        try:
+            if is_wav and (not have_ffmpeg or _wav_ok_for_rhubarb(
+                    _ffprobe_from(ffmpeg), audio_in)):
+                self._procs = [subprocess.Popen(
+                    [rhubarb,"-f","json",audio_in,"-o",self._out_txt])]
+            elif have_ffmpeg:
+                # Pipe ffmpeg's WAV output straight into rhubarb's stdin —
+                # no intermediate file, no second disk pass.
+                p1 = subprocess.Popen(
+                    [ffmpeg,"-i",audio_in,"-ac","1","-ar","22050",
+                     "-f","wav","-"],
+                    stdout=subprocess.PIPE)
+                p2 = subprocess.Popen(
+                    [rhubarb,"-f","json","-o",self._out_txt,"-"],
+                    stdin=p1.stdout)
+                p1.stdout.close()
+                self._procs = [p1, p2]
+            else:
+                # fallback: convert to a temp WAV on disk, then run rhubarb
+                out_wav = os.path.splitext(audio_in)[0] + "_conv.wav"
+                self._procs = [subprocess.Popen(
+                    [ffmpeg,"-y","-i",audio_in,
+                     "-ac","1","-ar","22050",out_wav])]
+                self._pending = [
+                    [rhubarb,"-f","json",out_wav,"-o",self._out_txt]]
+        except OSError as e:
+            self.report({'ERROR'},f"Could not start pipeline: {e}")
+            return {'CANCELLED'}
+        wm = context.window_manager
+        # poll on a timer instead of blocking — UI stays responsive
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        context.area.header_text_set("Rhubarb running…")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            for proc in self._procs:
+                proc.terminate()
+            self._finish(context)
+            self.report({'WARNING'},"Rhubarb cancelled")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if any(proc.poll() is None for proc in self._procs):
+            return {'PASS_THROUGH'}
+        if any(proc.returncode for proc in self._procs):
+            self._finish(context)
+            self.report({'ERROR'},"FFmpeg/Rhubarb pipeline failed")
+            return {'CANCELLED'}
+        if self._pending:
+            try:
+                self._procs = [subprocess.Popen(self._pending.pop(0))]
+            except OSError as e:
+                self._finish(context)
+                self.report({'ERROR'},f"Could not start pipeline: {e}")
+                return {'CANCELLED'}
+            return {'PASS_THROUGH'}
+        self._finish(context)
+        context.scene.lipsync_props.rhubarb_txt = self._out_txt
+        self.report({'INFO'},f"Output → {self._out_txt}")
+        return {'FINISHED'}
+
+    def _finish(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if context.area:
+            context.area.header_text_set(None)
+
+class OT_BatchRunRhubarb(Operator):
+    bl_idname = "lipsync.batch_run_rhubarb"
+    bl_label = "Batch Run Rhubarb"
+    bl_description = "Convert & analyze every audio file in a folder in parallel"
+    bl_options = {'REGISTER'}
+    def execute(self, context):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        p = context.scene.lipsync_props
+        folder = bpy.path.abspath(p.batch_dir)
+        ffmpeg = bpy.path.abspath(p.ffmpeg_exe)
+        rhubarb = bpy.path.abspath(p.rhubarb_exe)
+        if not os.path.isdir(folder):
+            self.report({'ERROR'},"Batch folder not found")
+            return {'CANCELLED'}
+        files = sorted(
+            os.path.join(folder, f) for f in os.listdir(folder)
+            if os.path.splitext(f)[1].lower() in AUDIO_EXTS)
+        if not files:
+            self.report({'WARNING'},"No audio files in folder")
+            return {'CANCELLED'}
+        workers = p.batch_workers or os.cpu_count() or 1
+        wavs = []
+        conv = []
+        for src in files:
+            if src.lower().endswith(".wav"):
+                wavs.append(src)
+            else:
+                dst = os.path.splitext(src)[0] + "_conv.wav"
+                conv.append(([ffmpeg,"-y","-i",src,
+                              "-ac","1","-ar","22050",dst], dst))
+        wm = context.window_manager
+        # converted files are counted twice: once for the ffmpeg pass,
+        # once more when rhubarb analyzes the resulting wav
+        total = 2*len(conv) + len(wavs)
+        wm.progress_begin(0, total)
+        done = 0
+        failed = []
+        try:
+            # Threads, not processes: each task just blocks on subprocess.run,
+            # and a process pool inside Blender's embedded Python would spawn
+            # whole new Blender instances via sys.executable on Windows/macOS.
+            # ffmpeg is mostly single-threaded for simple conversions, so N
+            # workers still give near-linear speedup.
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futs = {pool.submit(_run_cmd, cmd): dst for cmd, dst in conv}
+                for fut in as_completed(futs):
+                    if fut.result() == 0:
+                        wavs.append(futs[fut])
+                    else:
+                        failed.append(futs[fut])
+                    done += 1
+                    wm.progress_update(done)
+                futs = {}
+                for wav in wavs:
+                    out_txt = os.path.splitext(wav)[0] + "_rhubarb.txt"
+                    futs[pool.submit(_run_cmd,
+                        [rhubarb,"-f","json",wav,"-o",out_txt])] = out_txt
+                for fut in as_completed(futs):
+                    if fut.result() != 0:
+                        failed.append(futs[fut])
+                    done += 1
+                    wm.progress_update(done)
+        finally:
+            wm.progress_end()
+        for path in failed:
+            self.report({'WARNING'},f"Failed: {os.path.basename(path)}")
+        self.report({'INFO'},f"Processed {len(wavs)} file(s) with {workers} workers"
+                    + (f", {len(failed)} failed" if failed else ""))
         return {'FINISHED'}
 
 class OT_ImportVisemes(Operator):
@@ -160,13 +466,15 @@ class OT_ImportVisemes(Operator):
     bl_options = {'REGISTER'}
     def execute(self, context):
         p = context.scene.lipsync_props
-        cues = parse_rhubarb_json(bpy.path.abspath(p.rhubarb_txt))
-        names = sorted({c["value"] for c in cues})
-        existing = {v.name for v in p.visemes}
+        _, _, values = load_cues_soa(bpy.path.abspath(p.rhubarb_txt))
+        names = np.unique(values)
+        visemes = p.visemes
+        existing = viseme_index(p)
         for n in names:
             if n not in existing:
-                v = p.visemes.add()
+                v = visemes.add()
                 v.name = n
+        _tag_redraw(context)
         self.report({'INFO'},f"Imported {len(names)} visemes")
         return {'FINISHED'}
 
@@ -200,38 +508,134 @@ class OT_GenerateLipsync(Operator):
     def execute(self, context):
         p = context.scene.lipsync_props
         obj = context.object
+        # Hoist every RNA/abspath read to a local before the hot path;
+        # each access below would otherwise go through a property descriptor
         bone = obj.pose.bones.get(p.target_bone)
-        cues = parse_rhubarb_json(bpy.path.abspath(p.rhubarb_txt))
-        fps = context.scene.render.fps / context.scene.render.fps_base
-        prev = None; cnt = 0
-        for c in cues:
-            nm = c["value"]
-            m = next((v for v in p.visemes if v.name==nm), None)
-            if not m: continue
-            st = int(c["start"]*fps)
-            ed = int(c.get("end",c["start"]+0.1)*fps)
-            for f in range(st, ed+1, p.frame_step):
-                if prev and p.blend_frames>0 and f < st + p.blend_frames:
-                    t = (f - st)/p.blend_frames
-                    loc = (
-                        prev[0]*(1-t) + m.position[0]*t,
-                        prev[1]*(1-t) + m.position[1]*t,
-                        prev[2]*(1-t) + m.position[2]*t,
-                    )
-                else:
-                    loc = m.position
-                bone.location = loc
-                bone.keyframe_insert("location", frame=f)
-                cnt += 1
-            prev = m.position
-        self.report({'INFO'},f"Inserted {cnt} keyframes")
+        render = context.scene.render
+        fps = render.fps / render.fps_base
+        step = p.frame_step
+        blend = p.blend_frames
+        interp = p.key_interpolation
+        starts, ends, values = load_cues_soa(bpy.path.abspath(p.rhubarb_txt))
+        vindex = viseme_index(p)
+        st_i = (starts*fps).astype(np.int32)
+        ed_i = (ends*fps).astype(np.int32)
+        # Map cue names to rows of a (V,3) position matrix, then build the
+        # whole curve with repeats/fancy indexing — no per-cue Python loop.
+        if len(values) == 0:
+            self.report({'WARNING'},"No keyframes to insert")
+            return {'CANCELLED'}
+        uniq, inv = np.unique(values, return_inverse=True)
+        known = np.array([u in vindex for u in uniq])
+        zero = np.zeros(3, dtype=np.float32)
+        pos_matrix = np.stack([
+            vindex[u][1] if u in vindex else zero for u in uniq])
+        mask = known[inv]
+        if not mask.any():
+            self.report({'WARNING'},"No keyframes to insert")
+            return {'CANCELLED'}
+        st_f = st_i[mask]; ed_f = ed_i[mask]
+        targets = pos_matrix[inv[mask]]
+        counts = np.maximum(ed_f - st_f, 0) // step + 1
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        if _build_locs_jit is not None:
+            all_frames, all_locs = _build_locs_jit(
+                st_f, ed_f, targets, step, blend)
+        else:
+            prevs = np.vstack([targets[:1], targets[:-1]])
+            starts_rep = np.repeat(st_f, counts).astype(np.float32)
+            all_frames = starts_rep + step * (
+                np.arange(counts.sum()) - np.repeat(offsets, counts)
+            ).astype(np.float32)
+            if blend > 0:
+                t = np.minimum((all_frames - starts_rep) / blend, 1.0)[:,None]
+            else:
+                t = np.ones((len(all_frames), 1), dtype=np.float32)
+            t[:counts[0]] = 1.0  # first cue has nothing to blend from
+            all_locs = np.repeat(prevs, counts, axis=0)*(1.0-t) \
+                     + np.repeat(targets, counts, axis=0)*t
+        # "Only insert needed": drop keys whose value repeats the previous
+        # one, but always keep cue boundaries so timing edges survive
+        keep = np.concatenate(
+            ([True], np.any(all_locs[1:] != all_locs[:-1], axis=1)))
+        keep[offsets] = True
+        keep[np.minimum(offsets + counts - 1, len(keep)-1)] = True
+        all_frames = all_frames[keep]
+        all_locs = all_locs[keep]
+        # Contiguous or overlapping cues (the missing-'end' fallback can
+        # overshoot into the next cue) key the same frame more than once;
+        # keyframe_insert used to replace in place, foreach_set writes both.
+        # Stable-sort by frame and keep the last occurrence per frame so the
+        # later cue wins, matching the old replace semantics.
+        order = np.argsort(all_frames, kind='stable')
+        all_frames = all_frames[order]
+        all_locs = all_locs[order]
+        last = np.concatenate((all_frames[1:] != all_frames[:-1], [True]))
+        all_frames = all_frames[last]
+        all_locs = all_locs[last]
+        # Rule: the write phase must never call scene.frame_set — that forces
+        # a full depsgraph evaluation per key. foreach_set leaves the current
+        # frame alone; tag the object dirty exactly once at the end instead.
+        frame_orig = context.scene.frame_current
+        self.write_keyframes(obj, bone, all_frames, all_locs, interp)
+        assert context.scene.frame_current == frame_orig, \
+            "bulk keyframe write must not move the playhead"
+        obj.update_tag()
+        self.report({'INFO'},f"Inserted {len(all_frames)} keyframes")
         return {'FINISHED'}
 
+    def write_keyframes(self, obj, bone, frames, locs, interp='LINEAR'):
+        # Batched write: one keyframe_points.add + foreach_set per axis
+        # instead of a keyframe_insert per key (no per-key RNA/depsgraph cost).
+        anim = obj.animation_data or obj.animation_data_create()
+        if anim.action is None:
+            anim.action = bpy.data.actions.new(obj.name + "Action")
+        action = anim.action
+        data_path = f'pose.bones["{bone.name}"].location'
+        n = len(frames)
+        interp_enum = bpy.types.Keyframe.bl_rna.properties['interpolation']
+        interp_arr = np.full(n, interp_enum.enum_items[interp].value,
+                             dtype=np.int32)
+        # One contiguous (3, 2N) block, row per axis — the frames column is
+        # written once and stays cache-hot across all three foreach_set calls
+        co = np.empty((3, 2*n), dtype=np.float32)
+        co[:, 0::2] = frames
+        co[0, 1::2] = locs[:, 0]
+        co[1, 1::2] = locs[:, 1]
+        co[2, 1::2] = locs[:, 2]
+        if interp == 'BEZIER':
+            hl = co.copy(); hl[:, 0::2] -= 0.5
+            hr = co.copy(); hr[:, 0::2] += 0.5
+        for axis in range(3):
+            fc = action.fcurves.find(data_path, index=axis)
+            if fc is not None and len(fc.keyframe_points):
+                # Curve already has keys the user may want kept, so
+                # add+foreach_set (which rewrites every point) is not viable.
+                # Merge with FAST inserts: no re-sort per key, one update().
+                kp = fc.keyframe_points
+                vals = locs[:, axis]
+                for f in range(n):
+                    key = kp.insert(frames[f], vals[f],
+                                    options={'FAST','NEEDED'})
+                    key.interpolation = interp
+                fc.update()
+                continue
+            if fc is None:
+                fc = action.fcurves.new(data_path, index=axis,
+                                        action_group=bone.name)
+            fc.keyframe_points.add(n)
+            fc.keyframe_points.foreach_set("co", co[axis])
+            fc.keyframe_points.foreach_set("interpolation", interp_arr)
+            if interp == 'BEZIER':
+                # handles only matter for Bezier; skip the work otherwise
+                fc.keyframe_points.foreach_set("handle_left", hl[axis])
+                fc.keyframe_points.foreach_set("handle_right", hr[axis])
+            fc.update()
+
 # — UI List & Panel —
 class VISEME_UL_List(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
         row = layout.row(align=True)
-        row.prop(item, "preview", text="", icon='HIDE_OFF' if item.preview else 'HIDE_ON')
         row.prop(item, "name", text="", emboss=False)
         row.prop(item, "position", text="")
 
@@ -257,6 +661,12 @@ class VIEW3D_PT_LipsyncPanel(Panel):
         layout.prop(p, "rhubarb_exe", text="Rhubarb.exe")
         layout.operator("lipsync.run_rhubarb", icon='PLAY')
 
+        box = layout.box()
+        box.label(text="Batch:")
+        box.prop(p, "batch_dir", text="Folder")
+        box.prop(p, "batch_workers")
+        box.operator("lipsync.batch_run_rhubarb", icon='PLAY')
+
         layout.prop(p, "rhubarb_txt", text="Output TXT")
         layout.operator("lipsync.import_visemes", icon='IMPORT')
 
@@ -266,7 +676,9 @@ class VIEW3D_PT_LipsyncPanel(Panel):
         box.label(text="Timing:")
         box.prop(p, "frame_step")
         box.prop(p, "blend_frames")
+        box.prop(p, "key_interpolation")
 
+        layout.prop(p, "preview_active", text="Preview")
         row = layout.row()
         row.template_list("VISEME_UL_List", "", p, "visemes", p, "active_viseme_index", rows=6)
         col = row.column(align=True)
@@ -276,12 +688,34 @@ class VIEW3D_PT_LipsyncPanel(Panel):
         layout.operator("lipsync.generate_keys", icon='ARMATURE_DATA')
 
 # — Registration —
+_msgbus_owner = object()
+
+def _on_preview_change():
+    # msgbus coalesces notifier storms into one callback per actual change,
+    # unlike a per-property update= that fires on every RNA write
+    context = bpy.context
+    scene = context.scene
+    if scene is None: return
+    _apply_preview(scene.lipsync_props, context)
+
+def _subscribe_preview():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(LipsyncProperties, "preview_active"),
+        owner=_msgbus_owner, args=(), notify=_on_preview_change)
+
+@bpy.app.handlers.persistent
+def _on_load_post(_dummy):
+    # msgbus subscriptions are wiped whenever a .blend is loaded
+    _subscribe_preview()
+
 classes = (
     VisemeItem,
     LipsyncProperties,
     OT_ExportVisemePreset,
     OT_ImportVisemePreset,
     OT_RunRhubarb,
+    OT_BatchRunRhubarb,
     OT_ImportVisemes,
     OT_AddViseme,
     OT_RemoveViseme,
@@ -294,8 +728,13 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.lipsync_props = PointerProperty(type=LipsyncProperties)
+    _subscribe_preview()
+    bpy.app.handlers.load_post.append(_on_load_post)
 
 def unregister():
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.lipsync_props